@@ -7,9 +7,10 @@ Este módulo contém:
 """
 
 import streamlit as st
+import bisect
 from datetime import datetime, time
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import random
 
 from scheduler import Task, schedule_minimize_lateness
@@ -24,37 +25,134 @@ def safe_rerun():
         return
 
 
+@st.cache_resource
+def _plotly():
+    """Importa `plotly.express` sob demanda.
+
+    O módulo só é carregado quando há tarefas para exibir no gráfico Gantt.
+    """
+    import plotly.express as px
+    return px
+
+
+@st.cache_resource(max_entries=32)
+def _compute_schedule(key, start_time, _tasks_tuple):
+    """Reconstrói os objetos Task e calcula o cronograma EDF.
+
+    `_tasks_tuple` é uma tupla de tuplas (id, nome, duração, prazo,
+    prioridade, cliente), já em ordem de prazo. O Streamlit não faz hash de
+    parâmetros iniciados por `_`, então o cache usa apenas `key` (o `hash`
+    da tupla) e `start_time`; o resultado é compartilhado, sem cópia.
+    """
+    # A ordem dos campos da tupla coincide com a de Task: construção posicional
+    tasks = [Task(*row) for row in _tasks_tuple]
+    return schedule_minimize_lateness(tasks, start_time, presorted=True)
+
+
+@st.cache_resource(max_entries=16)
+def _build_gantt(key, _rows):
+    """Monta a figura Plotly do gráfico Gantt.
+
+    `_rows` é uma tupla de tuplas (tarefa, início, fim, atraso, prioridade,
+    cliente, prazo). O Streamlit não faz hash de parâmetros iniciados por
+    `_`, então o cache usa apenas `key`, derivada das tarefas e do início.
+    """
+    gantt_df = pd.DataFrame(
+        list(_rows),
+        columns=['Task', 'Start', 'Finish', 'Lateness (h)', 'Priority', 'Client', 'Deadline'],
+    )
+
+    # Definir cores baseadas no atraso (verde = no prazo, vermelho = atrasado)
+    late = gantt_df['Lateness (h)'].to_numpy() > 0
+    gantt_df['Color'] = np.where(late, 'red', 'green')
+
+    # Criar labels customizados para hover (concatenação vetorizada de strings)
+    deadline_str = gantt_df['Deadline'].dt.strftime('%d/%m/%Y %H:%M')
+    client_part = (' - ' + gantt_df['Client']).where(gantt_df['Client'] != '', '')
+    status = np.where(late, 'ATRASADA', 'NO PRAZO')
+    gantt_df['Label'] = (
+        gantt_df['Task'] + client_part
+        + '<br>Prazo: ' + deadline_str
+        + '<br>Prioridade: ' + gantt_df['Priority']
+        + '<br>Status: ' + status
+    )
+
+    # Criar gráfico Gantt com Plotly
+    px = _plotly()
+    fig = px.timeline(
+        gantt_df, 
+        x_start='Start', 
+        x_end='Finish', 
+        y='Task', 
+        color='Color',
+        color_discrete_map={'green': '#28a745', 'red': '#dc3545'},
+        title='Cronograma de Execução das Tarefas'
+    )
+
+    # Customizar hover
+    fig.update_traces(
+        hovertemplate='%{customdata[0]}<extra></extra>',
+        customdata=gantt_df[['Label']].values
+    )
+
+    # Ajustar layout
+    fig.update_yaxes(autorange='reversed')  # Primeira tarefa no topo
+    fig.update_layout(
+        height=max(400, len(gantt_df) * 50),  # Altura dinâmica baseada no número de tarefas
+        showlegend=False,
+        xaxis_title="Tempo",
+        yaxis_title="Tarefas"
+    )
+
+    return fig
+
+
 st.set_page_config(page_title='Planejador de Prazos', layout='wide')
 
 st.title('Planejador de Prazos')
 
-# Inicializar session_state com tarefas de exemplo
+# Inicializar session_state com tarefas de exemplo (prazos como pd.Timestamp)
 if 'tasks' not in st.session_state:
     st.session_state['tasks'] = [
-        {'id': 1, 'name': 'Petição Inicial', 'duration_hours': 4.0, 'deadline': datetime(2025,10,20,17,0), 'priority':'alta', 'client':'João'},
-        {'id': 2, 'name': 'Audiência', 'duration_hours': 2.0, 'deadline': datetime(2025,10,19,10,0), 'priority':'alta', 'client':'Maria'},
-        {'id': 3, 'name': 'Contestação', 'duration_hours': 3.0, 'deadline': datetime(2025,10,21,12,0), 'priority':'média', 'client':'José'},
+        {'id': 1, 'name': 'Petição Inicial', 'duration_hours': 4.0, 'deadline': pd.Timestamp(2025,10,20,17,0), 'priority':'alta', 'client':'João'},
+        {'id': 2, 'name': 'Audiência', 'duration_hours': 2.0, 'deadline': pd.Timestamp(2025,10,19,10,0), 'priority':'alta', 'client':'Maria'},
+        {'id': 3, 'name': 'Contestação', 'duration_hours': 3.0, 'deadline': pd.Timestamp(2025,10,21,12,0), 'priority':'média', 'client':'José'},
     ]
 
+# Próximo id disponível, mantido como contador para evitar varrer as tarefas
+st.session_state.setdefault('_next_id', max((t['id'] for t in st.session_state['tasks']), default=0) + 1)
+# Versão do editor de tarefas; incrementada para recriá-lo após gravar alterações
+st.session_state.setdefault('_editor_version', 0)
+# Índice (timestamp do prazo, id) mantido ordenado com bisect; `_tasks_resort`
+# pede a reconstrução completa quando prazos podem ter sido editados
+st.session_state.setdefault('_tasks_sorted', [])
+st.session_state.setdefault('_tasks_resort', True)
+
 
-def new_task_form():
+def new_task_form(now):
     """Renderiza o formulário lateral para cadastrar uma nova tarefa.
     
     O campo de duração usa `time_input` no formato HH:MM e, ao submeter, converte
     para horas (float) para armazenamento em `st.session_state['tasks']`.
+    `now` é o horário atual da execução, usado como prazo padrão.
     """
     st.sidebar.header('Cadastrar nova tarefa')
-    name = st.sidebar.text_input('Nome da tarefa', key='new_task_name')
-    duration_time = st.sidebar.time_input('Duração (HH:MM)', value=time(2, 0), key='new_task_duration')
-    dl_date = st.sidebar.date_input('Prazo (data)', value=datetime.now().date(), key='new_task_date')
-    dl_time = st.sidebar.time_input('Prazo (hora)', value=datetime.now().time(), key='new_task_time')
-    deadline = datetime.combine(dl_date, dl_time)
-    client = st.sidebar.text_input('Cliente (opcional)', key='new_task_client')
-    priority = st.sidebar.selectbox('Prioridade', ['alta', 'média', 'baixa'], key='new_task_priority')
+    # Os campos ficam em um formulário para que o script só reexecute ao submeter
+    with st.sidebar.form('new_task', clear_on_submit=True):
+        name = st.text_input('Nome da tarefa', key='new_task_name')
+        duration_time = st.time_input('Duração (HH:MM)', value=time(2, 0), key='new_task_duration')
+        dl_date = st.date_input('Prazo (data)', value=now.date(), key='new_task_date')
+        dl_time = st.time_input('Prazo (hora)', value=now.time(), key='new_task_time')
+        client = st.text_input('Cliente (opcional)', key='new_task_client')
+        priority = st.selectbox('Prioridade', ['alta', 'média', 'baixa'], key='new_task_priority')
+        submitted = st.form_submit_button('Adicionar tarefa')
     
-    if st.sidebar.button('Adicionar tarefa'):
+    if submitted:
+        # Prazos são guardados como pd.Timestamp para usar os caminhos rápidos do pandas
+        deadline = pd.Timestamp(datetime.combine(dl_date, dl_time))
         tasks = st.session_state.get('tasks', [])
-        next_id = max([t['id'] for t in tasks], default=0) + 1
+        next_id = st.session_state['_next_id']
+        st.session_state['_next_id'] += 1
         try:
             dt = duration_time
             duration = dt.hour + dt.minute / 60.0 + dt.second / 3600.0
@@ -69,113 +167,154 @@ def new_task_form():
             'client': client
         })
         st.session_state['tasks'] = tasks
+        bisect.insort(st.session_state['_tasks_sorted'], (deadline.to_pydatetime().timestamp(), next_id))
         st.sidebar.success('Tarefa adicionada!')
 
 
-new_task_form()
+# Horário atual calculado uma única vez por execução do script
+now = datetime.now()
+
+new_task_form(now)
 
 st.sidebar.markdown('---')
 if st.sidebar.button('Limpar tarefas'):
     st.session_state['tasks'] = []
+    st.session_state['_tasks_sorted'] = []
 
-st.header('Tarefas cadastradas')
-tasks_df = pd.DataFrame(st.session_state['tasks'])
-if not tasks_df.empty:
-    display_df = tasks_df.copy()
-    if 'client' not in display_df.columns:
-        display_df['client'] = ''
+
+def _tasks_from_editor(edited, now):
+    """Converte as linhas retornadas pelo `st.data_editor` em tarefas.
     
-    # Formatar duração (float horas) para HH:MM
-    def fmt_duration(h):
-        try:
-            total_minutes = int(round(float(h) * 60))
-            hh = total_minutes // 60
-            mm = total_minutes % 60
-            return f"{hh:02d}:{mm:02d}"
-        except Exception:
-            return str(h)
+    Linhas adicionadas no editor recebem um novo id do contador e valores
+    padrão (duração de 2h, prazo igual ao horário atual) nos campos vazios.
+    """
+    tasks = []
+    for rec in edited.to_dict('records'):
+        if pd.isna(rec['id']):
+            tid = st.session_state['_next_id']
+            st.session_state['_next_id'] += 1
+        else:
+            tid = int(rec['id'])
+        deadline = rec['deadline']
+        tasks.append({
+            'id': tid,
+            'name': rec['name'] if isinstance(rec['name'], str) else '',
+            'duration_hours': 2.0 if pd.isna(rec['duration_hours']) else float(rec['duration_hours']),
+            'deadline': pd.Timestamp(now) if pd.isna(deadline) else pd.Timestamp(deadline),
+            'priority': rec['priority'] if rec['priority'] in ('alta', 'média', 'baixa') else 'média',
+            'client': rec['client'] if isinstance(rec['client'], str) else '',
+        })
+    return tasks
+
+
+def _tasks_snapshot(tasks):
+    """Converte a lista de tarefas em uma tupla imutável de tuplas.
     
-    # Formatar prazo final para dd/mm/YYYY HH:MM
-    def fmt_deadline(d):
+    Usada como chave de cache: (id, nome, duração, prazo, prioridade, cliente).
+    O prazo sai como `datetime` puro: ordenar e subtrair `pd.Timestamp` no
+    laço do scheduler é várias vezes mais lento.
+    """
+    return tuple(
+        (t['id'], t['name'], t['duration_hours'], t['deadline'].to_pydatetime(), t.get('priority', 'média'), t.get('client', ''))
+        for t in tasks
+    )
+
+
+def _tasks_by_deadline():
+    """Retorna as tarefas em ordem de prazo a partir do índice `_tasks_sorted`.
+    
+    Inclusões feitas pelo formulário mantêm o índice ordenado via
+    `bisect.insort`. Como o resultado é passado com `presorted=True`, a ordem
+    do índice só é aceita se cobrir exatamente as tarefas atuais e os prazos
+    resolvidos forem não decrescentes; caso contrário (ou com `_tasks_resort`
+    marcado) as tarefas são reordenadas com `sorted()` e o índice é refeito.
+    """
+    tasks = st.session_state['tasks']
+    if not st.session_state['_tasks_resort']:
+        by_id = {t['id']: t for t in tasks}
         try:
-            return d.strftime('%d/%m/%Y %H:%M')
-        except Exception:
-            return str(d)
+            ordered = [by_id.pop(tid) for _, tid in st.session_state['_tasks_sorted']]
+        except KeyError:
+            ordered = None
+        if (
+            ordered is not None
+            and not by_id
+            and all(a['deadline'] <= b['deadline'] for a, b in zip(ordered, ordered[1:]))
+        ):
+            return ordered
     
-    # Aplicar formatações
-    if 'duration_hours' in display_df.columns:
-        display_df['duration_hours'] = display_df['duration_hours'].apply(fmt_duration)
-    if 'deadline' in display_df.columns:
-        display_df['deadline'] = display_df['deadline'].apply(fmt_deadline)
+    ordered = sorted(tasks, key=lambda t: t['deadline'])
+    st.session_state['_tasks_sorted'] = [(t['deadline'].to_pydatetime().timestamp(), t['id']) for t in ordered]
+    st.session_state['_tasks_resort'] = False
+    return ordered
+
+
+def fmt_tasks_df(tasks):
+    """Monta o DataFrame formatado da tabela 'Tarefas cadastradas'.
     
-    # Selecionar e renomear colunas para exibição
-    display_df = display_df[['id', 'name', 'duration_hours', 'deadline', 'priority', 'client']]
-    display_df = display_df.rename(columns={
-        'name': 'Tarefa',
-        'duration_hours': 'Duração',
-        'deadline': 'Prazo final',
-        'priority': 'Prioridade',
-        'client': 'Cliente',
+    O resultado fica guardado em `st.session_state` junto com uma impressão
+    digital das tarefas; se nada mudou desde a última execução, o DataFrame
+    anterior é devolvido sem refazer o trabalho do pandas.
+    """
+    fp = hash(_tasks_snapshot(tasks))
+    if st.session_state.get('_tasks_df_fp') == fp:
+        return st.session_state['_tasks_df']
+    
+    # Formatar duração (float horas) para HH:MM de forma vetorizada
+    durations = pd.Series([t['duration_hours'] for t in tasks], dtype='float64')
+    minutes = (durations * 60).round().astype('int64')
+    # Formatar prazo final para dd/mm/YYYY HH:MM
+    deadlines = pd.Series([t['deadline'] for t in tasks])
+    
+    # Montar o DataFrame de exibição de uma só vez, já com os nomes finais
+    display_df = pd.DataFrame({
+        'id': [t['id'] for t in tasks],
+        'Tarefa': [t['name'] for t in tasks],
+        'Duração': (minutes // 60).astype(str).str.zfill(2) + ':' + (minutes % 60).astype(str).str.zfill(2),
+        'Prazo final': deadlines.dt.strftime('%d/%m/%Y %H:%M'),
+        'Prioridade': [t.get('priority', 'média') for t in tasks],
+        'Cliente': [t.get('client', '') for t in tasks],
     })
+    
+    st.session_state['_tasks_df_fp'] = fp
+    st.session_state['_tasks_df'] = display_df
+    return display_df
+
+
+st.header('Tarefas cadastradas')
+if st.session_state['tasks']:
+    display_df = fmt_tasks_df(st.session_state['tasks'])
     st.table(display_df)
     
-    # Editor inline de tarefas
+    # Editor inline de tarefas (uma única grade em vez de widgets por linha)
     with st.expander('Editar / Remover tarefas'):
-        for idx, row in tasks_df.iterrows():
-            cols = st.columns([2, 1, 1, 1, 1])
-            name = cols[0].text_input(label=f"Tarefa {row['id']}", value=row['name'], key=f"nome_{row['id']}")
-            
-            # Converter duração de float para time para o time_input
-            try:
-                dh = float(row.get('duration_hours', 0.0))
-                dh_hours = int(dh)
-                dh_minutes = int(round((dh - dh_hours) * 60))
-                default_dur_time = time(dh_hours % 24, dh_minutes)
-            except Exception:
-                default_dur_time = time(2, 0)
-            
-            dur_time = cols[1].time_input(label=f"Duração {row['id']}", value=default_dur_time, key=f"dur_{row['id']}")
-            
-            # Converter deadline para date e time separados
-            try:
-                existing_deadline = row['deadline']
-                dl_date_val = existing_deadline.date()
-                dl_time_val = existing_deadline.time()
-            except Exception:
-                dl_date_val = datetime.now().date()
-                dl_time_val = datetime.now().time()
-            
-            dl_date = cols[2].date_input(label=f"Prazo (Data) {row['id']}", value=dl_date_val, key=f"dl_date_{row['id']}")
-            dl_time = cols[2].time_input(label=f"Prazo (Hora) {row['id']}", value=dl_time_val, key=f"dl_time_{row['id']}")
-            dl = datetime.combine(dl_date, dl_time)
-            
-            pr = cols[3].selectbox(label=f"Prioridade {row['id']}", options=['alta','média','baixa'], 
-                                 index=['alta','média','baixa'].index(row['priority']), key=f"pr_{row['id']}")
-            client_val = cols[0].text_input(label=f"Cliente {row['id']}", value=row.get('client',''), key=f"client_{row['id']}")
-            
-            # Botões de ação
-            if cols[4].button('Salvar', key=f'save_{row["id"]}'):
-                tasks = st.session_state['tasks']
-                for t in tasks:
-                    if t['id'] == row['id']:
-                        t['name'] = name
-                        try:
-                            dt = dur_time
-                            dur_hours = dt.hour + dt.minute / 60.0 + dt.second / 3600.0
-                        except Exception:
-                            dur_hours = float(row.get('duration_hours', 0.0))
-                        t['duration_hours'] = dur_hours
-                        t['deadline'] = dl
-                        t['priority'] = pr
-                        t['client'] = client_val
-                st.session_state['tasks'] = tasks
-                st.success(f'Tarefa "{name}" salva!')
-                safe_rerun()
-            
-            if cols[4].button('Remover', key=f'del_{row["id"]}'):
-                st.session_state['tasks'] = [t for t in st.session_state['tasks'] if t['id'] != row['id']]
-                st.success(f'Tarefa "{row["name"]}" removida!')
-                safe_rerun()
+        editor_key = f"tasks_editor_{st.session_state['_editor_version']}"
+        edited = st.data_editor(
+            pd.DataFrame(
+                st.session_state['tasks'],
+                columns=['id', 'name', 'duration_hours', 'deadline', 'priority', 'client'],
+            ),
+            key=editor_key,
+            num_rows='dynamic',
+            hide_index=True,
+            disabled=['id'],
+            column_config={
+                'id': st.column_config.NumberColumn('id'),
+                'name': st.column_config.TextColumn('Tarefa'),
+                'duration_hours': st.column_config.NumberColumn('Duração (h)', min_value=0.0, step=0.25, format='%.2f'),
+                'deadline': st.column_config.DatetimeColumn('Prazo', format='DD/MM/YYYY HH:mm'),
+                'priority': st.column_config.SelectboxColumn('Prioridade', options=['alta', 'média', 'baixa']),
+                'client': st.column_config.TextColumn('Cliente'),
+            },
+        )
+        
+        # Gravar as alterações e recriar o editor (nova chave) com os dados atualizados
+        changes = st.session_state[editor_key]
+        if changes['edited_rows'] or changes['added_rows'] or changes['deleted_rows']:
+            st.session_state['tasks'] = _tasks_from_editor(edited, now)
+            st.session_state['_editor_version'] += 1
+            st.session_state['_tasks_resort'] = True
+            safe_rerun()
 else:
     st.info('Nenhuma tarefa cadastrada. Use o formulário lateral para adicionar.')
 
@@ -185,28 +324,19 @@ st.header('Agenda otimizada (Earliest Deadline First)')
 # Configuração de horário de início
 col1, col2 = st.columns(2)
 with col1:
-    st_date = st.date_input('Início (data)', value=datetime.now().date())
+    st_date = st.date_input('Início (data)', value=now.date())
 with col2:
-    st_time = st.time_input('Início (hora)', value=datetime.now().time())
+    st_time = st.time_input('Início (hora)', value=now.time())
 
 start_time = datetime.combine(st_date, st_time)
 
 # Construir objetos Task e gerar cronograma
 if st.session_state['tasks']:
-    tasks = []
-    for t in st.session_state['tasks']:
-        task = Task(
-            id=t['id'], 
-            name=t['name'], 
-            duration_hours=float(t['duration_hours']), 
-            deadline=t['deadline'], 
-            priority=t.get('priority','média'), 
-            client=t.get('client','')
-        )
-        tasks.append(task)
+    tasks_tuple = _tasks_snapshot(_tasks_by_deadline())
     
-    # Gerar cronograma usando EDF
-    schedule_result = schedule_minimize_lateness(tasks, start_time)
+    # Gerar cronograma usando EDF (reaproveitado do cache se nada mudou)
+    schedule_result = _compute_schedule(hash(tasks_tuple), start_time, tasks_tuple)
+    tasks = [r['task'] for r in schedule_result['ordered']]
     
     # Exibir métricas
     col1, col2 = st.columns(2)
@@ -217,90 +347,34 @@ if st.session_state['tasks']:
     
     # Exibir cronograma em tabela
     st.subheader('Cronograma de execução')
-    schedule_rows = []
-    for r in schedule_result['ordered']:
-        t = r['task']
-        schedule_rows.append({
-            'Tarefa': t.name,
-            'Cliente': t.client,
-            'Início': r['start'].strftime('%d/%m/%Y %H:%M'),
-            'Fim': r['finish'].strftime('%d/%m/%Y %H:%M'),
-            'Duração': f"{t.duration_hours:.2f}h",
-            'Prazo': t.deadline.strftime('%d/%m/%Y %H:%M'),
-            'Atraso (h)': f"{r['lateness_hours']:.2f}",
-            'Prioridade': t.priority
-        })
-    
-    schedule_df = pd.DataFrame(schedule_rows)
+    # Formatar colunas de data de uma só vez (strftime vetorizado por coluna)
+    date_fmt = '%d/%m/%Y %H:%M'
+    sdf = pd.DataFrame(schedule_result['ordered'], columns=['task', 'start', 'finish', 'lateness_hours'])
+    ordered_tasks = sdf['task'].tolist()
+    durations = pd.Series([t.duration_hours for t in ordered_tasks], dtype='float64')
+    deadlines = pd.Series([t.deadline for t in ordered_tasks])
+    schedule_df = pd.DataFrame({
+        'Tarefa': [t.name for t in ordered_tasks],
+        'Cliente': [t.client for t in ordered_tasks],
+        'Início': sdf['start'].dt.strftime(date_fmt),
+        'Fim': sdf['finish'].dt.strftime(date_fmt),
+        'Duração': durations.map('{:.2f}h'.format),
+        'Prazo': deadlines.dt.strftime(date_fmt),
+        'Atraso (h)': sdf['lateness_hours'].map('{:.2f}'.format),
+        'Prioridade': [t.priority for t in ordered_tasks],
+    })
     st.table(schedule_df)
     
     # Gráfico Gantt
     st.subheader('Gráfico Gantt')
     
-    # Preparar dados para o gráfico Gantt
-    gantt_rows = []
-    for r in schedule_result['ordered']:
-        t = r['task']
-        gantt_rows.append({
-            'Task': t.name,
-            'Start': r['start'],
-            'Finish': r['finish'],
-            'Lateness (h)': round(r['lateness_hours'], 2),
-            'Priority': t.priority,
-            'Client': t.client,
-            'Deadline': t.deadline,
-        })
-    
-    gantt_df = pd.DataFrame(gantt_rows)
-    
-    # Definir cores baseadas no atraso (verde = no prazo, vermelho = atrasado)
-    gantt_df['Color'] = gantt_df['Lateness (h)'].apply(lambda x: 'red' if x > 0 else 'green')
-    
-    # Função para formatar prazo no hover
-    def format_deadline(val):
-        try:
-            return val.strftime('%d/%m/%Y %H:%M')
-        except Exception:
-            return str(val)
-    
-    # Criar labels customizados para hover
-    def make_label(r):
-        task = r.get('Task', '')
-        client = r.get('Client', '')
-        client_part = f" - {client}" if client else ""
-        deadline_str = format_deadline(r.get('Deadline'))
-        priority = r.get('Priority', '')
-        lateness = r.get('Lateness (h)', 0)
-        status = "ATRASADA" if lateness > 0 else "NO PRAZO"
-        return f"{task}{client_part}<br>Prazo: {deadline_str}<br>Prioridade: {priority}<br>Status: {status}"
-    
-    gantt_df['Label'] = gantt_df.apply(make_label, axis=1)
-    
-    # Criar gráfico Gantt com Plotly
-    fig = px.timeline(
-        gantt_df, 
-        x_start='Start', 
-        x_end='Finish', 
-        y='Task', 
-        color='Color',
-        color_discrete_map={'green': '#28a745', 'red': '#dc3545'},
-        title='Cronograma de Execução das Tarefas'
-    )
-    
-    # Customizar hover
-    fig.update_traces(
-        hovertemplate='%{customdata[0]}<extra></extra>',
-        customdata=gantt_df[['Label']].values
-    )
-    
-    # Ajustar layout
-    fig.update_yaxes(autorange='reversed')  # Primeira tarefa no topo
-    fig.update_layout(
-        height=max(400, len(gantt_df) * 50),  # Altura dinâmica baseada no número de tarefas
-        showlegend=False,
-        xaxis_title="Tempo",
-        yaxis_title="Tarefas"
+    # Preparar dados para o gráfico Gantt (figura reaproveitada do cache)
+    gantt_rows = tuple(
+        (r['task'].name, r['start'], r['finish'], round(r['lateness_hours'], 2),
+         r['task'].priority, r['task'].client, r['task'].deadline)
+        for r in schedule_result['ordered']
     )
+    fig = _build_gantt(hash((tasks_tuple, start_time)), gantt_rows)
     
     st.plotly_chart(fig, use_container_width=True)
     
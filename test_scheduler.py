@@ -0,0 +1,97 @@
+"""Testes de `schedule_minimize_lateness` contra a implementação original."""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+import scheduler
+from scheduler import Task, _schedule_vectorized, schedule_minimize_lateness
+
+
+START = datetime(2025, 10, 19, 8, 0)
+
+
+def _reference_schedule(tasks, start_time):
+    """Implementação original com `timedelta`, usada como referência."""
+    current = start_time
+    rows = []
+    for task in sorted(tasks, key=lambda t: t.deadline):
+        finish = current + timedelta(hours=task.duration_hours)
+        lateness = max(timedelta(0), finish - task.deadline)
+        rows.append((task.id, current, finish, lateness.total_seconds() / 3600.0))
+        current = finish
+    return rows
+
+
+def _random_tasks(n, seed):
+    rng = random.Random(seed)
+    return [
+        Task(i, f't{i}', rng.randint(1, 300) / 60, START + timedelta(minutes=rng.randint(-600, 20000)))
+        for i in range(n)
+    ]
+
+
+def _assert_matches_reference(result, tasks):
+    expected = _reference_schedule(tasks, START)
+    rows = [(r['task'].id, r['start'], r['finish'], r['lateness_hours']) for r in result['ordered']]
+
+    assert [row[:3] for row in rows] == [row[:3] for row in expected]
+    assert [row[3] for row in rows] == pytest.approx([row[3] for row in expected])
+    assert result['total_lateness_hours'] == pytest.approx(sum(row[3] for row in expected))
+    assert result['max_lateness_hours'] == pytest.approx(max((row[3] for row in expected), default=0.0))
+
+
+PATHS = [schedule_minimize_lateness, _schedule_vectorized]
+
+
+@pytest.mark.parametrize('schedule', PATHS)
+@pytest.mark.parametrize('n', [0, 1, 5, 40, 200])
+def test_matches_reference(schedule, n):
+    tasks = _random_tasks(n, seed=n)
+    _assert_matches_reference(schedule(tasks, START), tasks)
+
+
+def test_large_list_uses_vectorized_path(monkeypatch):
+    calls = []
+
+    def spy(tasks, start_time, presorted=False):
+        calls.append(len(tasks))
+        return _schedule_vectorized(tasks, start_time, presorted)
+
+    monkeypatch.setattr(scheduler, '_schedule_vectorized', spy)
+
+    tasks = _random_tasks(scheduler.VECTORIZE_MIN_TASKS, seed=1)
+    _assert_matches_reference(schedule_minimize_lateness(tasks, START), tasks)
+    schedule_minimize_lateness(tasks[:-1], START)
+
+    assert calls == [scheduler.VECTORIZE_MIN_TASKS]
+
+
+@pytest.mark.parametrize('schedule', PATHS)
+@pytest.mark.parametrize('n', [5, 40])
+def test_presorted_skips_sort_with_same_result(schedule, n):
+    tasks = sorted(_random_tasks(n, seed=n), key=lambda t: t.deadline)
+    _assert_matches_reference(schedule(tasks, START, presorted=True), tasks)
+
+
+@pytest.mark.parametrize('schedule', PATHS)
+def test_presorted_trusts_given_order(schedule):
+    late_first = [Task(1, 'A', 1.0, START + timedelta(hours=5)), Task(2, 'B', 1.0, START + timedelta(hours=1))]
+    result = schedule(late_first, START, presorted=True)
+    assert [r['task'].id for r in result['ordered']] == [1, 2]
+
+
+@pytest.mark.parametrize('schedule', PATHS)
+@pytest.mark.parametrize('minutes', range(1, 60))
+def test_task_finishing_on_deadline_is_not_late(schedule, minutes):
+    duration = 1 + minutes / 60
+    first_deadline = START + timedelta(hours=1, minutes=minutes)
+    tasks = [
+        Task(1, 'A', duration, first_deadline),
+        Task(2, 'B', duration, first_deadline + timedelta(hours=1, minutes=minutes)),
+    ]
+
+    result = schedule(tasks, START)
+    assert [r['lateness_hours'] for r in result['ordered']] == [0.0, 0.0]
+    assert result['total_lateness_hours'] == 0.0